@@ -2,28 +2,81 @@
 
 from __future__ import annotations
 
+import json
 import os
+import tempfile
 from typing import Any, Optional
 
 import yaml
 from dotenv import load_dotenv
 
+# Prefer the libyaml C bindings when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 load_dotenv()
 
 _config_cache: dict[str, Any] = {}
+_env_cache: dict[str, Optional[str]] = {}
 
 
 def deep_merge(base: dict, override: dict) -> dict:
-    """Recursively merge override into base."""
-    result = base.copy()
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
-        else:
-            result[key] = value
+    """Merge override into base without mutating either input."""
+    result = dict(base)
+    stack = [(result, override)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                # Copy only the branches that are actually overridden
+                target[key] = merged = dict(current)
+                stack.append((merged, value))
+            else:
+                target[key] = value
     return result
 
 
+def _read_yaml(config_path: str) -> dict[str, Any]:
+    """Read a YAML file, reusing a JSON sidecar cache while the YAML is unchanged."""
+    cache_path = config_path + ".cache.json"
+
+    try:
+        if os.path.getmtime(cache_path) >= os.path.getmtime(config_path):
+            with open(cache_path, "r") as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    with open(config_path, "r") as f:
+        yaml_config = yaml.load(f, Loader=_YamlLoader) or {}
+
+    # Only cache configs JSON reproduces exactly (e.g. non-string keys would
+    # come back as strings and the warm path would differ from the cold one)
+    try:
+        serialized = json.dumps(yaml_config)
+        if json.loads(serialized) != yaml_config:
+            return yaml_config
+    except (TypeError, ValueError):
+        return yaml_config
+
+    # Write atomically so a concurrent reader never sees a partial file.
+    # The cache is best-effort (read-only dir, ...).
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path) or ".")
+        with os.fdopen(fd, "w") as f:
+            f.write(serialized)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    return yaml_config
+
+
 def load_config(config_path: str = "config.yaml") -> dict[str, Any]:
     """Load configuration from YAML file with environment variable overrides."""
     global _config_cache
@@ -57,9 +110,7 @@ def load_config(config_path: str = "config.yaml") -> dict[str, Any]:
 
     # Load from YAML if exists
     if os.path.exists(config_path):
-        with open(config_path, "r") as f:
-            yaml_config = yaml.safe_load(f) or {}
-            config = deep_merge(config, yaml_config)
+        config = deep_merge(config, _read_yaml(config_path))
 
     # Environment variable overrides
     if os.getenv("POSITION_POLL_INTERVAL_MS"):
@@ -76,8 +127,14 @@ def load_config(config_path: str = "config.yaml") -> dict[str, Any]:
 
 
 def get_env(key: str, required: bool = True) -> Optional[str]:
-    """Get environment variable with optional requirement check."""
-    value = os.getenv(key)
+    """Get environment variable with optional requirement check.
+
+    Values are read once and cached for the lifetime of the process.
+    """
+    if key in _env_cache:
+        value = _env_cache[key]
+    else:
+        value = _env_cache[key] = os.environ.get(key)
     if required and not value:
         raise ValueError(f"Required environment variable {key} is not set")
     return value
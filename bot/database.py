@@ -2,31 +2,69 @@
 
 from __future__ import annotations
 
+import atexit
 import os
-from datetime import datetime
+import queue
+import threading
+import time
 from typing import Any, List, Optional
 
-import requests
-
 from bot.config import get_env
+from bot.http_client import get_session, json_dumps, json_loads
 from bot.logger import get_logger
 
 logger = get_logger()
 
+TRADE_BATCH_SIZE = 20
+TRADE_BATCH_WINDOW = 1.0  # seconds
+
+_INSERT_TRADE_SQL = """
+    INSERT INTO trade_history
+    (timestamp, market_title, token_id, outcome, action, entry_price,
+     exit_price, shares, loss_percentage, order_id, status)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 _initialized = False
+_init_lock = threading.Lock()
+_db_url: Optional[str] = None
+
+# Pending trade rows, written in batches by a background thread
+_trade_queue: queue.Queue = queue.Queue()
+_writer_thread: Optional[threading.Thread] = None
+_writer_lock = threading.Lock()
 
 
 def _get_db_url() -> str:
     """Get the HTTP API URL from the libsql URL."""
-    db_url = get_env("TURSO_DATABASE_URL")
-    # Convert libsql:// to https://
-    if db_url.startswith("libsql://"):
-        db_url = db_url.replace("libsql://", "https://")
-    return db_url
+    global _db_url
 
+    if _db_url is None:
+        db_url = get_env("TURSO_DATABASE_URL")
+        # Convert libsql:// to https://
+        if db_url.startswith("libsql://"):
+            db_url = db_url.replace("libsql://", "https://")
+        _db_url = db_url
+    return _db_url
 
-def _execute(sql: str, args: Optional[List] = None) -> dict:
-    """Execute a SQL statement via Turso HTTP API."""
+
+def _utc_timestamp() -> str:
+    """Current UTC time in the same ISO format as datetime.utcnow().isoformat()."""
+    now = time.time()
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(now)) + ".%06d" % (now % 1 * 1e6)
+
+
+def _statement(sql: str, args: Optional[List] = None) -> dict:
+    """Build a single Turso HTTP API statement."""
+    statement = {"q": sql}
+    if args:
+        # Params are simple values (strings, numbers, or null)
+        statement["params"] = [str(v) if v is not None else None for v in args]
+    return statement
+
+
+def _execute_batch(statements: List[dict]) -> list:
+    """Execute several statements in one Turso HTTP API request."""
     db_url = _get_db_url()
     auth_token = get_env("TURSO_AUTH_TOKEN")
 
@@ -35,26 +73,25 @@ def _execute(sql: str, args: Optional[List] = None) -> dict:
         "Content-Type": "application/json",
     }
 
-    # Build request body for Turso HTTP API
-    # Format: {"statements": [{"q": "...", "params": [...]}]}
-    statement = {"q": sql}
-    if args:
-        # Params are simple values (strings, numbers, or null)
-        statement["params"] = [str(v) if v is not None else None for v in args]
-
+    # Format: {"statements": [{"q": "...", "params": [...]}, ...]}
     body = {
-        "statements": [statement]
+        "statements": statements
     }
 
-    response = requests.post(
+    response = get_session().post(
         db_url,
-        json=body,
+        data=json_dumps(body),
         headers=headers,
         timeout=30,
     )
     response.raise_for_status()
 
-    return response.json()
+    return json_loads(response.content)
+
+
+def _execute(sql: str, args: Optional[List] = None) -> list:
+    """Execute a SQL statement via Turso HTTP API."""
+    return _execute_batch([_statement(sql, args)])
 
 
 def init_tables() -> None:
@@ -64,6 +101,15 @@ def init_tables() -> None:
     if _initialized:
         return
 
+    with _init_lock:
+        if _initialized:
+            return
+        _create_tables()
+        _initialized = True
+
+
+def _create_tables() -> None:
+    """Create the trade history table if it does not exist."""
     sql = """
         CREATE TABLE IF NOT EXISTS trade_history (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -83,13 +129,74 @@ def init_tables() -> None:
 
     try:
         _execute(sql)
-        _initialized = True
         logger.debug("Database tables initialized")
     except Exception as e:
-        logger.error(f"Failed to initialize database: {e}")
+        logger.error("Failed to initialize database: %s", e)
         raise
 
 
+def _write_trades(rows: List[List]) -> None:
+    """Insert a batch of trade rows in a single request."""
+    try:
+        init_tables()
+        result = _execute_batch([_statement(_INSERT_TRADE_SQL, row) for row in rows])
+    except Exception as e:
+        logger.error("Failed to log %s trade(s) to database: %s", len(rows), e)
+        return
+
+    # Response is a list of results, one per statement
+    for row, item in zip(rows, result or []):
+        action, status = row[4], row[10]
+        if "error" in item:
+            logger.error("Failed to log trade to database: %s", item["error"])
+            continue
+        trade_id = item.get("results", {}).get("last_insert_rowid")
+        logger.info(
+            "Trade logged to database: action=%s, status=%s, id=%s", action, status, trade_id
+        )
+
+
+def _drain_trades() -> None:
+    """Background loop that batches queued trades into Turso requests."""
+    while True:
+        batch = [_trade_queue.get()]
+        deadline = time.monotonic() + TRADE_BATCH_WINDOW
+        while len(batch) < TRADE_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_trade_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        try:
+            _write_trades(batch)
+        finally:
+            for _ in batch:
+                _trade_queue.task_done()
+
+
+def _ensure_writer() -> None:
+    """Start the background trade writer on first use."""
+    global _writer_thread
+
+    with _writer_lock:
+        if _writer_thread is not None:
+            return
+        _writer_thread = threading.Thread(
+            target=_drain_trades, name="trade-writer", daemon=True
+        )
+        _writer_thread.start()
+        atexit.register(flush_trades)
+
+
+def flush_trades() -> None:
+    """Block until every queued trade has been written (or failed)."""
+    if _writer_thread is not None:
+        _trade_queue.join()
+
+
 def log_trade(
     market_title: str,
     token_id: str,
@@ -101,19 +208,14 @@ def log_trade(
     loss_percentage: float,
     order_id: Optional[str],
     status: str,
-) -> Optional[int]:
-    """Log a trade to the database."""
-    init_tables()
-
-    sql = """
-        INSERT INTO trade_history
-        (timestamp, market_title, token_id, outcome, action, entry_price,
-         exit_price, shares, loss_percentage, order_id, status)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+) -> None:
     """
+    Queue a trade to be logged to the database.
 
-    args = [
-        datetime.utcnow().isoformat(),
+    Returns immediately; rows are written in batches by a background thread.
+    """
+    row = [
+        _utc_timestamp(),
         market_title,
         token_id,
         outcome,
@@ -126,30 +228,27 @@ def log_trade(
         status,
     ]
 
-    try:
-        result = _execute(sql, args)
-        logger.info(f"Trade logged to database: action={action}, status={status}")
-        # Response is a list of results
-        if result and len(result) > 0:
-            return result[0].get("results", {}).get("last_insert_rowid")
-        return None
-    except Exception as e:
-        logger.error(f"Failed to log trade to database: {e}")
-        return None
+    _ensure_writer()
+    _trade_queue.put(row)
 
 
 def get_trade_history(limit: int = 100) -> List[dict]:
-    """Retrieve recent trade history."""
-    init_tables()
+    """
+    Retrieve recent trade history.
 
-    sql = f"""
+    Expects init_tables() to have run at startup.
+    """
+    if not isinstance(limit, int) or isinstance(limit, bool) or limit < 0:
+        raise ValueError(f"limit must be a non-negative integer, got {limit!r}")
+
+    sql = """
         SELECT * FROM trade_history
         ORDER BY timestamp DESC
-        LIMIT {limit}
+        LIMIT ?
     """
 
     try:
-        result = _execute(sql)
+        result = _execute(sql, [limit])
 
         # Response is a list: [{"results": {"columns": [...], "rows": [...]}}]
         if not result or len(result) == 0:
@@ -161,5 +260,5 @@ def get_trade_history(limit: int = 100) -> List[dict]:
 
         return [dict(zip(columns, row)) for row in rows]
     except Exception as e:
-        logger.error(f"Failed to get trade history: {e}")
+        logger.error("Failed to get trade history: %s", e)
         return []
@@ -0,0 +1,55 @@
+"""Shared HTTP session for Turso, Telegram and Polymarket API calls."""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Prefer orjson for request/response bodies when it is installed
+try:
+    import orjson
+
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize obj to a JSON request body."""
+        return orjson.dumps(obj)
+
+    def json_loads(data: bytes) -> Any:
+        """Parse a JSON response body."""
+        return orjson.loads(data)
+
+except ImportError:
+    import json
+
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize obj to a JSON request body."""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def json_loads(data: bytes) -> Any:
+        """Parse a JSON response body."""
+        return json.loads(data)
+
+
+_session: Optional[requests.Session] = None
+
+
+def get_session() -> requests.Session:
+    """Get or create the pooled keep-alive session shared across the bot."""
+    global _session
+
+    if _session is not None:
+        return _session
+
+    session = requests.Session()
+    # Retries are handled by the monitor loop, not the transport
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(total=0),
+    )
+    session.mount("https://", adapter)
+
+    _session = session
+    return session
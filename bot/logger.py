@@ -58,3 +58,23 @@ def get_logger(name: str = "polymarket_bot") -> logging.Logger:
 
     _logger = logger
     return logger
+
+
+def tail_log(max_bytes: int = 1_000_000) -> str:
+    """Return the tail of the current log file, reading at most max_bytes."""
+    from bot.config import load_config
+
+    log_file = load_config().get("logging", {}).get("file", "logs/bot.log")
+    if not os.path.exists(log_file):
+        return ""
+
+    with open(log_file, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        f.seek(max(0, size - max_bytes))
+        data = f.read()
+
+    # Drop the partial first line when starting mid-file
+    if size > max_bytes:
+        data = data.partition(b"\n")[2]
+
+    return data.decode("utf-8", errors="replace")
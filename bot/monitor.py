@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import time
-from typing import Optional, Dict, Any
+from typing import Any, Dict, Optional, Tuple
 from requests.exceptions import RequestException, Timeout
 
 from bot.config import load_config
 from bot.database import log_trade, init_tables
 from bot.logger import get_logger
+from bot.orderbook_ws import subscribe as subscribe_orderbook
 from bot.notifications import (
     notify_error,
     notify_position_closed,
@@ -16,14 +17,23 @@ from bot.notifications import (
     notify_stop_loss,
     send_telegram,
 )
-from bot.position import calculate_stop_loss_trigger, get_positions
-from bot.trading import close_position
+from bot.position import (
+    calculate_stop_loss_trigger,
+    first_active_position,
+    get_positions,
+)
+from bot.trading import CLOSE_DEDUPE_WINDOW, reconcile, submit_close_position
 
 logger = get_logger()
 
 MAX_RETRIES = 3
 RETRY_DELAY = 5  # seconds
 
+STATUS_LABELS = ("IN PROFIT", "IN LOSS", "STOP-LOSS HIT!")
+
+# Per-tick status line; formatted by logging only when INFO is enabled
+TICK_LOG_FORMAT = "[%s] %s | %s | Entry: %.4f | Now: %.4f | P/L: %.2f%%"
+
 
 def notify_new_position(
     title: str,
@@ -45,6 +55,94 @@ def notify_new_position(
     send_telegram(msg)
 
 
+def finish_stop_loss(result: Dict[str, Any], trade: Dict[str, Any]) -> bool:
+    """Log, record and notify the outcome of a stop-loss close. Returns success."""
+    # Repeats of an earlier close were already recorded and notified
+    if result.get("deduped"):
+        logger.info("Position %s already closed, not recording again", trade["token_id"])
+        return True
+    if result.get("breaker_open"):
+        logger.warning("Close still paused after market failures: %s", result.get("error"))
+        return False
+
+    order_id = result.get("orderID") or result.get("order_id")
+    # Check success: orderID present means order was placed, or explicit success=False for errors
+    if result.get("success") is False:
+        success = False
+    else:
+        success = order_id is not None
+    status = "SUCCESS" if success else "FAILED"
+
+    logger.info(
+        "Order result: success=%s, order_id=%s, status=%s", success, order_id, status
+    )
+
+    # Queue for database (written in the background) so the
+    # notification goes out without waiting on Turso
+    try:
+        log_trade(
+            market_title=trade["title"],
+            token_id=trade["token_id"],
+            outcome=trade["outcome"],
+            action="STOP_LOSS",
+            entry_price=trade["entry_price"],
+            exit_price=trade["exit_price"],
+            shares=trade["size"],
+            loss_percentage=trade["loss_pct"],
+            order_id=order_id,
+            status=status,
+        )
+    except Exception as e:
+        logger.error("Failed to queue trade for database: %s", e)
+
+    # Send notification with order status
+    notify_stop_loss(
+        market_title=trade["title"],
+        outcome=trade["outcome"],
+        entry_price=trade["entry_price"],
+        exit_price=trade["exit_price"],
+        loss_pct=trade["loss_pct"],
+        shares=trade["size"],
+        order_id=order_id,
+        success=success,
+    )
+
+    if success:
+        logger.info("Position closed successfully!")
+        logger.info("Order ID: %s", order_id)
+    else:
+        error_msg = result.get("error", "Unknown error")
+        logger.error("Failed to close position: %s", error_msg)
+        notify_error(f"Failed to close position: {error_msg}")
+
+    return success
+
+
+def wait_for_close(pending_close: Optional[Dict[str, Any]], timeout: float) -> None:
+    """Wait up to timeout for an in-flight close to finish."""
+    if pending_close is None:
+        return
+    try:
+        pending_close["future"].result(timeout=timeout)
+    except Exception:
+        # Timeouts and failures are both picked up by reconcile()
+        pass
+
+
+def collect_close(pending_close: Optional[Dict[str, Any]]) -> None:
+    """
+    Report the outcome of an in-flight close once its future is done.
+
+    Stores whether it succeeded under "success"; the monitor loop applies that
+    to its own state at the start of the next tick.
+    """
+    if pending_close is None or "success" in pending_close:
+        return
+    if pending_close["future"].done():
+        result = reconcile(pending_close["request_id"])
+        pending_close["success"] = finish_stop_loss(result, pending_close["trade"])
+
+
 def run_monitor() -> None:
     """Run the main monitoring loop."""
     config = load_config()
@@ -55,14 +153,14 @@ def run_monitor() -> None:
     logger.info("=" * 60)
     logger.info("POLYMARKET STOP-LOSS BOT")
     logger.info("=" * 60)
-    logger.info(f"Stop-Loss Threshold: {stop_loss_pct}%")
-    logger.info(f"Poll Interval: {poll_interval} seconds")
+    logger.info("Stop-Loss Threshold: %s%%", stop_loss_pct)
+    logger.info("Poll Interval: %s seconds", poll_interval)
 
     try:
         init_tables()
         logger.info("Database: Connected successfully")
     except Exception as e:
-        logger.warning(f"Database: Connection failed - {e}")
+        logger.warning("Database: Connection failed - %s", e)
         logger.warning("Continuing without database logging...")
 
     logger.info("=" * 60)
@@ -72,13 +170,27 @@ def run_monitor() -> None:
     current_position_id: Optional[str] = None  # Track current position
     # Store position details for notification when position closes
     tracked_position: Dict[str, Any] = {}
+    # Stop-loss close running on the submission thread, if any
+    pending_close: Optional[Dict[str, Any]] = None
+    # (token_id, size, close time) of the last stop-loss; the Data API keeps
+    # listing a sold position for a while
+    closed_position: Optional[Tuple[str, float, float]] = None
 
     while True:
         try:
+            # Collect the outcome of an in-flight stop-loss close
+            collect_close(pending_close)
+            if pending_close is not None and "success" in pending_close:
+                if pending_close["success"]:
+                    current_position_id = None  # Reset so we detect next position
+                    trade = pending_close["trade"]
+                    closed_position = (trade["token_id"], trade["size"], time.monotonic())
+                pending_close = None
+
             positions = get_positions()
 
             if not positions:
-                if current_position_id is not None:
+                if current_position_id is not None and pending_close is None:
                     logger.info("=" * 60)
                     logger.info("POSITION CLOSED")
                     logger.info("=" * 60)
@@ -93,23 +205,18 @@ def run_monitor() -> None:
                         )
                     current_position_id = None
                     tracked_position = {}
+                closed_position = None
                 logger.info("Waiting for positions...")
                 time.sleep(poll_interval)
                 consecutive_errors = 0
                 continue
 
             # Find the first active position (with valid current price)
-            active_pos = None
-            for pos in positions:
-                cur_price = float(pos.get("curPrice", 0))
-                entry = float(pos.get("avgPrice", 0))
-                if cur_price > 0 and entry > 0:
-                    active_pos = pos
-                    break
+            active_pos = first_active_position(positions)
 
             if active_pos is None:
                 # Market resolved - position no longer has valid prices
-                if current_position_id is not None:
+                if current_position_id is not None and pending_close is None:
                     logger.info("=" * 60)
                     logger.info("MARKET RESOLVED - Position closed")
                     logger.info("=" * 60)
@@ -126,16 +233,23 @@ def run_monitor() -> None:
                     tracked_position = {}
                 else:
                     logger.info("No active positions with valid prices (markets may be resolved)")
+                closed_position = None
                 time.sleep(poll_interval)
                 continue
 
-            pos = active_pos
-            entry_price = float(pos.get("avgPrice", 0))
-            current_price = float(pos.get("curPrice", 0))
-            size = float(pos.get("size", 0))
-            token_id = pos.get("asset", "")
-            title = pos.get("title", "Unknown Market")
-            outcome = pos.get("outcome", "")
+            token_id, entry_price, current_price, size, title, outcome = active_pos
+
+            # Same token and size shortly after the close is the stale listing;
+            # anything else (e.g. the outcome bought again) is monitored as usual
+            if (
+                closed_position is not None
+                and closed_position[:2] == (token_id, size)
+                and time.monotonic() - closed_position[2] < CLOSE_DEDUPE_WINDOW
+            ):
+                logger.info("Waiting for closed position to leave the Data API...")
+                time.sleep(poll_interval)
+                continue
+            closed_position = None
 
             # Update tracked position details (for notifications on close)
             tracked_position = {
@@ -151,110 +265,80 @@ def run_monitor() -> None:
             if token_id != current_position_id:
                 logger.info("=" * 60)
                 logger.info("NEW POSITION DETECTED!")
-                logger.info(f"Market: {title}")
-                logger.info(f"Outcome: {outcome}")
-                logger.info(f"Entry Price: {entry_price:.4f}")
-                logger.info(f"Position Size: {size:.2f} shares")
+                logger.info("Market: %s", title)
+                logger.info("Outcome: %s", outcome)
+                logger.info("Entry Price: %.4f", entry_price)
+                logger.info("Position Size: %.2f shares", size)
                 sl_trigger_price = entry_price * (1 - stop_loss_pct / 100)
-                logger.info(f"Stop-Loss will trigger at: {sl_trigger_price:.4f} ({stop_loss_pct}% drop)")
+                logger.info(
+                    "Stop-Loss will trigger at: %.4f (%s%% drop)", sl_trigger_price, stop_loss_pct
+                )
                 logger.info("=" * 60)
 
                 # Send Telegram notification for new position
                 notify_new_position(title, outcome, entry_price, size, stop_loss_pct)
+                subscribe_orderbook(token_id)
                 current_position_id = token_id
 
             should_trigger, price_drop_pct = calculate_stop_loss_trigger(
                 entry_price, current_price, stop_loss_pct
             )
 
-            # Determine status emoji/indicator
-            if price_drop_pct >= stop_loss_pct:
-                status_indicator = "STOP-LOSS HIT!"
-            elif price_drop_pct > 0:
-                status_indicator = "IN LOSS"
-            else:
-                status_indicator = "IN PROFIT"
+            # Determine status indicator (index 0/1/2 by how far the price fell)
+            status_indicator = STATUS_LABELS[
+                (price_drop_pct > 0) + (price_drop_pct >= stop_loss_pct)
+            ]
 
             logger.info(
-                f"[{status_indicator}] {title[:35]} | "
-                f"{outcome} | "
-                f"Entry: {entry_price:.4f} | "
-                f"Now: {current_price:.4f} | "
-                f"P/L: {-price_drop_pct:.2f}%"
+                TICK_LOG_FORMAT,
+                status_indicator,
+                title[:35],
+                outcome,
+                entry_price,
+                current_price,
+                -price_drop_pct,
             )
 
-            if should_trigger:
-                logger.warning("=" * 60)
-                logger.warning(f"STOP-LOSS TRIGGERED!")
-                logger.warning(f"Price dropped {price_drop_pct:.2f}% (threshold: {stop_loss_pct}%)")
-                logger.warning(f"Closing position: {size:.2f} shares at market price")
+            if should_trigger and pending_close is None:
                 logger.warning("=" * 60)
-
-                result = close_position(token_id, size)
-
-                order_id = result.get("orderID") or result.get("order_id")
-                # Check success: orderID present means order was placed, or explicit success=False for errors
-                if result.get("success") is False:
-                    success = False
-                else:
-                    success = order_id is not None
-                status = "SUCCESS" if success else "FAILED"
-
-                logger.info(f"Order result: success={success}, order_id={order_id}, status={status}")
-
-                # Log to database
-                try:
-                    trade_id = log_trade(
-                        market_title=title,
-                        token_id=token_id,
-                        outcome=outcome,
-                        action="STOP_LOSS",
-                        entry_price=entry_price,
-                        exit_price=current_price,
-                        shares=size,
-                        loss_percentage=price_drop_pct,
-                        order_id=order_id,
-                        status=status,
-                    )
-                    if trade_id:
-                        logger.info(f"Trade logged to database (ID: {trade_id})")
-                    else:
-                        logger.warning("Trade logged but no ID returned")
-                except Exception as e:
-                    logger.error(f"Failed to log trade to database: {e}")
-
-                # Send notification with order status
-                notify_stop_loss(
-                    market_title=title,
-                    outcome=outcome,
-                    entry_price=entry_price,
-                    exit_price=current_price,
-                    loss_pct=price_drop_pct,
-                    shares=size,
-                    order_id=order_id,
-                    success=success,
+                logger.warning("STOP-LOSS TRIGGERED!")
+                logger.warning(
+                    "Price dropped %.2f%% (threshold: %s%%)", price_drop_pct, stop_loss_pct
                 )
+                logger.warning("Closing position: %.2f shares at market price", size)
+                logger.warning("=" * 60)
 
-                if success:
-                    logger.info("Position closed successfully!")
-                    logger.info(f"Order ID: {order_id}")
-                    current_position_id = None  # Reset so we detect next position
-                else:
-                    error_msg = result.get("error", "Unknown error")
-                    logger.error(f"Failed to close position: {error_msg}")
-                    notify_error(f"Failed to close position: {error_msg}")
+                ack = submit_close_position(token_id, size)
+                pending_close = {
+                    "request_id": ack["request_id"],
+                    "future": ack["future"],
+                    "trade": {
+                        "title": title,
+                        "token_id": token_id,
+                        "outcome": outcome,
+                        "entry_price": entry_price,
+                        "exit_price": current_price,
+                        "size": size,
+                        "loss_pct": price_drop_pct,
+                    },
+                }
 
             consecutive_errors = 0
-            time.sleep(poll_interval)
+
+            # Report a close as soon as it lands, but keep the poll cadence
+            deadline = time.monotonic() + poll_interval
+            wait_for_close(pending_close, poll_interval)
+            collect_close(pending_close)
+            time.sleep(max(0, deadline - time.monotonic()))
 
         except Timeout as e:
             consecutive_errors += 1
-            logger.warning(f"Request timeout (attempt {consecutive_errors}): {e}")
+            logger.warning("Request timeout (attempt %s): %s", consecutive_errors, e)
             time.sleep(min(RETRY_DELAY * consecutive_errors, 60))
 
         except RequestException as e:
             consecutive_errors += 1
-            logger.error(f"Network error (attempt {consecutive_errors}): {e}")
+            logger.error("Network error (attempt %s): %s", consecutive_errors, e)
             if consecutive_errors >= MAX_RETRIES:
                 notify_error(f"Network issues: {e}")
             time.sleep(min(RETRY_DELAY * consecutive_errors, 60))
@@ -267,6 +351,6 @@ def run_monitor() -> None:
             break
 
         except Exception as e:
-            logger.exception(f"Unexpected error: {e}")
+            logger.exception("Unexpected error: %s", e)
             notify_error(str(e))
             time.sleep(poll_interval)
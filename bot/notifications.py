@@ -2,18 +2,80 @@
 
 from __future__ import annotations
 
-import os
-from typing import Optional
+from typing import NamedTuple, Optional
 
 import requests
 
-from bot.config import load_config
+from bot.config import get_env, load_config
+from bot.http_client import get_session
 from bot.logger import get_logger
 
 logger = get_logger()
 
 TELEGRAM_API_URL = "https://api.telegram.org/bot{token}/sendMessage"
 
+STOP_LOSS_TEMPLATE = (
+    "<b>%s STOP-LOSS %s</b>\n\n"
+    "<b>Market:</b> %s\n"
+    "<b>Outcome:</b> %s\n"
+    "<b>Entry Price:</b> $%.4f\n"
+    "<b>Exit Price:</b> $%.4f\n"
+    "<b>Loss:</b> -%.2f%%\n"
+    "<b>Shares Sold:</b> %.2f\n"
+)
+
+POSITION_CLOSED_TEMPLATE = (
+    "<b>%s POSITION %s</b>\n\n"
+    "<b>Market:</b> %s\n"
+    "<b>Outcome:</b> %s\n"
+    "<b>Entry Price:</b> $%.4f\n"
+    "<b>Final Price:</b> $%.4f\n"
+    "<b>P/L:</b> %s%.2f%%\n"
+    "<b>Shares:</b> %.2f\n"
+    "<b>Reason:</b> %s"
+)
+
+
+def _parse_chat_id(chat_id: Optional[str]) -> Optional[int]:
+    """Parse TELEGRAM_CHAT_ID into the integer the Bot API expects."""
+    if not chat_id:
+        return None
+    try:
+        return int(chat_id)
+    except ValueError as e:
+        logger.error(f"Invalid TELEGRAM_CHAT_ID format: {e}")
+        return None
+
+
+class _TelegramFlags(NamedTuple):
+    """Per-event notification switches, resolved once from config."""
+
+    enabled: bool
+    on_start: bool
+    on_stop_loss: bool
+    on_error: bool
+
+
+def _build_flags(telegram_cfg: dict, configured: bool) -> _TelegramFlags:
+    """Fold the config flags together with whether Telegram is configured."""
+    enabled = configured and bool(telegram_cfg.get("enabled", True))
+    return _TelegramFlags(
+        enabled=enabled,
+        on_start=enabled and bool(telegram_cfg.get("notify_on_start", True)),
+        on_stop_loss=enabled and bool(telegram_cfg.get("notify_on_stop_loss", True)),
+        on_error=enabled and bool(telegram_cfg.get("notify_on_error", True)),
+    )
+
+
+# Telegram settings are fixed for the process lifetime, so resolve them once
+_token = get_env("TELEGRAM_BOT_TOKEN", required=False)
+_chat_id = _parse_chat_id(get_env("TELEGRAM_CHAT_ID", required=False))
+_api_url = TELEGRAM_API_URL.format(token=_token) if _token else None
+_flags = _build_flags(
+    load_config().get("telegram", {}),
+    configured=_api_url is not None and _chat_id is not None,
+)
+
 
 def send_telegram(message: str) -> bool:
     """
@@ -22,29 +84,18 @@ def send_telegram(message: str) -> bool:
     Returns True if successful, False otherwise.
     Fails silently if Telegram is not configured or disabled.
     """
-    config = load_config()
-    telegram_config = config.get("telegram", {})
-
-    if not telegram_config.get("enabled", True):
-        logger.debug("Telegram notifications disabled")
-        return False
-
-    token = os.getenv("TELEGRAM_BOT_TOKEN")
-    chat_id = os.getenv("TELEGRAM_CHAT_ID")
-
-    if not token or not chat_id:
-        logger.debug("Telegram not configured, skipping notification")
+    if not _flags.enabled:
+        logger.debug("Telegram disabled or not configured, skipping notification")
         return False
 
     try:
-        url = TELEGRAM_API_URL.format(token=token)
         payload = {
-            "chat_id": int(chat_id),  # Ensure chat_id is an integer
+            "chat_id": _chat_id,
             "text": message,
             "parse_mode": "HTML",
         }
 
-        response = requests.post(url, json=payload, timeout=10)
+        response = get_session().post(_api_url, json=payload, timeout=10)
 
         if not response.ok:
             logger.error(f"Telegram API error: {response.text}")
@@ -56,15 +107,11 @@ def send_telegram(message: str) -> bool:
     except requests.RequestException as e:
         logger.error(f"Failed to send Telegram notification: {e}")
         return False
-    except ValueError as e:
-        logger.error(f"Invalid TELEGRAM_CHAT_ID format: {e}")
-        return False
 
 
 def notify_start(stop_loss_pct: float) -> None:
     """Send bot startup notification."""
-    config = load_config()
-    if config.get("telegram", {}).get("notify_on_start", True):
+    if _flags.on_start:
         send_telegram(f"Polymarket SL Bot started. Monitoring for {stop_loss_pct}% stop-loss.")
 
 
@@ -79,27 +126,29 @@ def notify_stop_loss(
     success: bool = True,
 ) -> None:
     """Send stop-loss execution notification."""
-    config = load_config()
-    if config.get("telegram", {}).get("notify_on_stop_loss", True):
-        status_emoji = "✅" if success else "❌"
-        status_text = "EXECUTED" if success else "FAILED"
+    if not _flags.on_stop_loss:
+        return
 
-        msg = (
-            f"<b>{status_emoji} STOP-LOSS {status_text}</b>\n\n"
-            f"<b>Market:</b> {market_title}\n"
-            f"<b>Outcome:</b> {outcome}\n"
-            f"<b>Entry Price:</b> ${entry_price:.4f}\n"
-            f"<b>Exit Price:</b> ${exit_price:.4f}\n"
-            f"<b>Loss:</b> -{loss_pct:.2f}%\n"
-            f"<b>Shares Sold:</b> {shares:.2f}\n"
-        )
+    status_emoji = "✅" if success else "❌"
+    status_text = "EXECUTED" if success else "FAILED"
+
+    msg = STOP_LOSS_TEMPLATE % (
+        status_emoji,
+        status_text,
+        market_title,
+        outcome,
+        entry_price,
+        exit_price,
+        loss_pct,
+        shares,
+    )
 
-        if order_id:
-            msg += f"<b>Order ID:</b> <code>{order_id}</code>"
-        elif not success:
-            msg += "<b>Note:</b> Order may need manual intervention"
+    if order_id:
+        msg += f"<b>Order ID:</b> <code>{order_id}</code>"
+    elif not success:
+        msg += "<b>Note:</b> Order may need manual intervention"
 
-        send_telegram(msg)
+    send_telegram(msg)
 
 
 def notify_position_closed(
@@ -111,8 +160,7 @@ def notify_position_closed(
     reason: str = "Position Closed",
 ) -> None:
     """Send notification when a tracked position closes (win/loss/manual)."""
-    config = load_config()
-    if not config.get("telegram", {}).get("enabled", True):
+    if not _flags.enabled:
         return
 
     # Calculate P/L
@@ -137,15 +185,17 @@ def notify_position_closed(
 
     pnl_sign = "+" if pnl_pct >= 0 else ""
 
-    msg = (
-        f"<b>{status_emoji} POSITION {result}</b>\n\n"
-        f"<b>Market:</b> {title}\n"
-        f"<b>Outcome:</b> {outcome}\n"
-        f"<b>Entry Price:</b> ${entry_price:.4f}\n"
-        f"<b>Final Price:</b> ${last_price:.4f}\n"
-        f"<b>P/L:</b> {pnl_sign}{pnl_pct:.2f}%\n"
-        f"<b>Shares:</b> {size:.2f}\n"
-        f"<b>Reason:</b> {reason}"
+    msg = POSITION_CLOSED_TEMPLATE % (
+        status_emoji,
+        result,
+        title,
+        outcome,
+        entry_price,
+        last_price,
+        pnl_sign,
+        pnl_pct,
+        size,
+        reason,
     )
 
     send_telegram(msg)
@@ -153,6 +203,5 @@ def notify_position_closed(
 
 def notify_error(error_message: str) -> None:
     """Send error notification."""
-    config = load_config()
-    if config.get("telegram", {}).get("notify_on_error", True):
+    if _flags.on_error:
         send_telegram(f"<b>Bot Error:</b> {error_message}")
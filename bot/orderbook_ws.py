@@ -0,0 +1,182 @@
+"""Local top-of-book from the Polymarket CLOB market WebSocket feed."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from typing import Any, Dict, Optional, Set
+
+from bot.logger import get_logger
+
+# The feed is optional: without websocket-client the book is simply unknown
+try:
+    import websocket
+except ImportError:
+    websocket = None
+
+logger = get_logger()
+
+WS_MARKET_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
+PING_INTERVAL = 10  # seconds
+RECONNECT_DELAY = 5  # seconds
+
+# A book with no snapshot or update for this long is treated as unknown
+BOOK_MAX_AGE = 300  # seconds
+
+# Smallest notional (best bid * shares) a market sell is expected to fill at
+MIN_FILLABLE_USD = 1.0
+
+# token_id -> {price: size} for the bid side of the book, and when it last changed
+_bids: Dict[str, Dict[float, float]] = {}
+_updated: Dict[str, float] = {}
+_subscribed: Set[str] = set()
+_ws: Optional[Any] = None
+_thread: Optional[threading.Thread] = None
+_lock = threading.Lock()
+
+
+def _apply_book(message: Dict[str, Any]) -> None:
+    """Replace the bid side from a full book snapshot."""
+    bids = message.get("bids") or message.get("buys") or []
+    _bids[message["asset_id"]] = {
+        float(level["price"]): float(level["size"])
+        for level in bids
+        if float(level["size"]) > 0
+    }
+    _updated[message["asset_id"]] = time.monotonic()
+
+
+def _apply_price_change(message: Dict[str, Any]) -> None:
+    """Apply incremental level updates to known books."""
+    changes = message.get("price_changes") or message.get("changes") or []
+    for change in changes:
+        token_id = change.get("asset_id") or message.get("asset_id")
+        if change.get("side") != "BUY" or token_id not in _bids:
+            continue
+        # Copy-on-write so readers on other threads never see a dict mid-update
+        bids = dict(_bids[token_id])
+        price, size = float(change["price"]), float(change["size"])
+        if size > 0:
+            bids[price] = size
+        else:
+            bids.pop(price, None)
+        _bids[token_id] = bids
+        _updated[token_id] = time.monotonic()
+
+
+def _reset_books() -> None:
+    """Forget every book; they are unknown until the next snapshot arrives."""
+    _bids.clear()
+    _updated.clear()
+
+
+def _on_close(ws: Any, *args: Any) -> None:
+    """Drop books that stopped receiving updates when the feed went away."""
+    _reset_books()
+
+
+def _on_error(ws: Any, error: Exception) -> None:
+    logger.warning(f"Orderbook feed error: {error}")
+    _reset_books()
+
+
+def _on_message(ws: Any, raw: str) -> None:
+    """Dispatch feed events; the server may batch several into one frame."""
+    if raw == "PONG":
+        return
+    try:
+        payload = json.loads(raw)
+    except ValueError:
+        logger.debug(f"Ignoring non-JSON orderbook message: {raw[:50]}")
+        return
+
+    for message in payload if isinstance(payload, list) else [payload]:
+        event_type = message.get("event_type")
+        if event_type == "book":
+            _apply_book(message)
+        elif event_type == "price_change":
+            _apply_price_change(message)
+
+
+def _on_open(ws: Any) -> None:
+    """Subscribe to every tracked token on (re)connect."""
+    ws.send(json.dumps({"assets_ids": sorted(_subscribed), "type": "market"}))
+    threading.Thread(target=_ping, args=(ws,), daemon=True).start()
+
+
+def _run() -> None:
+    """Keep the feed connected, reconnecting after drops."""
+    global _ws
+
+    while True:
+        # Books from a previous connection may have missed updates
+        _reset_books()
+        _ws = websocket.WebSocketApp(
+            WS_MARKET_URL,
+            on_open=_on_open,
+            on_message=_on_message,
+            on_close=_on_close,
+            on_error=_on_error,
+        )
+        try:
+            _ws.run_forever()
+        except Exception as e:
+            logger.warning(f"Orderbook feed error: {e}")
+        _reset_books()
+        time.sleep(RECONNECT_DELAY)
+
+
+def _ping(ws: Any) -> None:
+    """Send the application-level keepalive the market channel expects."""
+    while True:
+        time.sleep(PING_INTERVAL)
+        try:
+            ws.send("PING")
+        except Exception:
+            return
+
+
+def subscribe(token_id: str) -> None:
+    """Start tracking the book for token_id, starting the feed on first use."""
+    global _thread
+
+    if websocket is None or token_id in _subscribed:
+        return
+
+    with _lock:
+        _subscribed.add(token_id)
+        if _thread is None:
+            _thread = threading.Thread(target=_run, name="orderbook-ws", daemon=True)
+            _thread.start()
+        elif _ws is not None:
+            # Reconnect so the subscription covers the new token
+            _ws.close()
+
+
+def _fresh_bids(token_id: str) -> Optional[Dict[float, float]]:
+    """Bid side for token_id, or None if no recent snapshot is held."""
+    bids = _bids.get(token_id)
+    if bids is None or time.monotonic() - _updated.get(token_id, 0) > BOOK_MAX_AGE:
+        return None
+    return bids
+
+
+def best_bid(token_id: str) -> Optional[float]:
+    """Best bid price for token_id, or None if the book is unknown or empty."""
+    bids = _fresh_bids(token_id)
+    return max(bids) if bids else None
+
+
+def is_fillable(token_id: str, size: float) -> Optional[bool]:
+    """
+    Whether a market sell of `size` shares has provable depth.
+
+    Returns None when no fresh book is held (caller should not block).
+    """
+    bids = _fresh_bids(token_id)
+    if bids is None:
+        return None
+    if not bids:
+        return False
+    return max(bids) * size >= MIN_FILLABLE_USD
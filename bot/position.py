@@ -2,11 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
-
-import requests
+from typing import Any, Dict, List, Optional, Tuple
 
 from bot.config import get_env, load_config
+from bot.http_client import get_session, json_loads
 from bot.logger import get_logger
 
 logger = get_logger()
@@ -41,18 +40,43 @@ def get_positions() -> List[Dict[str, Any]]:
         "limit": 10,
     }
 
-    logger.debug(f"Fetching positions for {funder_address}")
+    logger.debug("Fetching positions for %s", funder_address)
 
-    response = requests.get(DATA_API_URL, params=params, timeout=30)
+    response = get_session().get(DATA_API_URL, params=params, timeout=30)
     response.raise_for_status()
 
-    positions = response.json()
+    positions = json_loads(response.content)
 
-    logger.debug(f"Found {len(positions)} positions")
+    logger.debug("Found %s positions", len(positions))
 
     return positions
 
 
+def first_active_position(
+    positions: List[Dict[str, Any]],
+) -> Optional[Tuple[str, float, float, float, str, str]]:
+    """
+    Return the first position with valid prices, or None.
+
+    Returns:
+        Tuple of (token_id, entry_price, current_price, size, title, outcome).
+        The Data API returns JSON numbers, so no float() conversion is needed.
+    """
+    for p in positions:
+        entry_price = p.get("avgPrice") or 0.0
+        current_price = p.get("curPrice") or 0.0
+        if current_price > 0 and entry_price > 0:
+            return (
+                p.get("asset", ""),
+                entry_price,
+                current_price,
+                p.get("size") or 0.0,
+                p.get("title", "Unknown Market"),
+                p.get("outcome", ""),
+            )
+    return None
+
+
 def calculate_stop_loss_trigger(
     entry_price: float,
     current_price: float,
@@ -2,42 +2,152 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import queue
+import random
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from decimal import ROUND_DOWN, Decimal
+from typing import Any, Dict, List, Optional, Tuple
 
 from py_clob_client.client import ClobClient
-from py_clob_client.clob_types import ApiCreds, MarketOrderArgs, OrderType
+from py_clob_client.clob_types import (
+    ApiCreds,
+    MarketOrderArgs,
+    OrderType,
+    PostOrdersArgs,
+    TradeParams,
+)
+from py_clob_client.exceptions import PolyApiException
 from py_clob_client.order_builder.constants import SELL
 
+from bot import orderbook_ws
 from bot.config import get_env
 from bot.logger import get_logger
 
 logger = get_logger()
+# Level is fixed once get_logger() has configured it, so check it only once
+_debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
 CLOB_HOST = "https://clob.polymarket.com"
 CHAIN_ID = 137  # Polygon mainnet
 
-_clob_client: Optional[ClobClient] = None
+# FOK sell amounts are sent with 2 decimals (known py-clob-client issue)
+SIZE_QUANTUM = Decimal("0.01")
+MIN_ORDER_SIZE = 0.01  # shares, used when the market's own minimum is unknown
 
+# Signature types tried in order: 2=POLY_GNOSIS_SAFE, 1=POLY_PROXY, 0=EOA
+SIGNATURE_TYPES = (2, 1, 0)
+_SIG_TYPE_NAMES = {0: "EOA", 1: "POLY_PROXY", 2: "POLY_GNOSIS_SAFE"}
 
-def get_clob_client(force_new: bool = False, signature_type: int = 2) -> ClobClient:
-    """Initialize and return CLOB client with credentials."""
-    global _clob_client
+# Error message matchers for failures that carry no usable HTTP status
+_SIG_ERR_RE = re.compile(r"invalid signature", re.IGNORECASE)
+_NO_BOOK_RE = re.compile(r"No orderbook exists")
+_AUTH_ERR_RE = re.compile(r"Unauthorized|Invalid api key")
 
-    if _clob_client is not None and not force_new:
-        return _clob_client
+# Exponential backoff with jitter between order submission retries
+RETRY_BASE_DELAY = 1.0  # seconds
+RETRY_MAX_DELAY = 30.0  # seconds
+RETRY_JITTER = 0.5  # +/- fraction of the delay
 
-    private_key = get_env("POLYMARKET_WALLET_PRIVATE_KEY")
-    funder = get_env("POLYMARKET_FUNDER_ADDRESS")
+# A token closed this recently is not sold again (the Data API lags behind fills)
+CLOSE_DEDUPE_WINDOW = 60  # seconds
+
+# Waits before each trade-history check after an ambiguous submit
+LANDED_CHECK_DELAYS = (1.0, 2.0, 4.0)  # seconds
+
+# After a close fails with no orderbook, a server error or a size below the market
+# minimum, further closes of the token return the cached failure for
+# BREAKER_BASE_DELAY * 2**failures seconds
+BREAKER_BASE_DELAY = 5  # seconds
+BREAKER_MAX_DELAY = 300  # seconds
+_BREAKER_ERRORS = ("No active orderbook", "Request failed", "Size too small")
+
+# Derived API credentials persisted across restarts (keyed by funder and signature type)
+CREDS_CACHE_PATH = os.path.expanduser("~/.polymarket-sl/creds.json")
+_creds_lock = threading.Lock()
+
+# Wallet settings, read from the environment on first use
+_private_key: Optional[str] = None
+_funder: Optional[str] = None
+
+# One authenticated client per signature type, rebuilt only on auth failure
+_clients: Dict[int, ClobClient] = {}
+
+# Pre-signs the order for every signature type in parallel
+_sign_executor = ThreadPoolExecutor(
+    max_workers=len(SIGNATURE_TYPES), thread_name_prefix="order-sign"
+)
+
+# Background order submission: a dedicated thread drains the queue so callers
+# never block on signing or the FOK round-trip. Futures keyed by request ID.
+_submit_q: queue.Queue = queue.Queue()
+_submitter_thread: Optional[threading.Thread] = None
+_submitter_lock = threading.Lock()
+_submissions: Dict[str, Future] = {}
+
+# Per-token close serialization and the last successful close of each token
+# (close time, shares sold, response)
+_close_locks: Dict[str, threading.Lock] = {}
+_closed_tokens: Dict[str, Tuple[float, float, Dict[str, Any]]] = {}
+
+# Minimum order size per token, from the CLOB order book summary
+_min_order_sizes: Dict[str, float] = {}
+
+# Circuit breaker per token: open-until timestamp, plus consecutive failure
+# count and the failure response returned while the breaker is open
+_breaker: Dict[str, float] = {}
+_breaker_failures: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+
+@dataclass
+class CloseRequest:
+    """A queued close_position() call and the future that receives its result."""
+
+    token_id: str
+    size: float
+    signature_types: Tuple[int, ...] = SIGNATURE_TYPES
+    future: Future = field(default_factory=Future)
+
+
+class RecoverableError(Exception):
+    """Order submission failure that may succeed on retry."""
+
+
+class UnrecoverableError(Exception):
+    """Order submission failure that retrying cannot fix."""
+
+
+class AmbiguousSubmitError(RecoverableError):
+    """Order post failed in a way that does not tell whether the order landed."""
 
-    # Strip 0x prefix if present (some versions require it without)
-    if private_key.startswith("0x"):
-        private_key_clean = private_key[2:]
-    else:
-        private_key_clean = private_key
 
-    # signature_type: 0=EOA, 1=POLY_PROXY, 2=POLY_GNOSIS_SAFE
-    sig_type_names = {0: "EOA", 1: "POLY_PROXY", 2: "POLY_GNOSIS_SAFE"}
-    logger.info(f"Deriving API credentials with signature_type={signature_type} ({sig_type_names.get(signature_type, 'unknown')})...")
+def _wallet() -> Tuple[str, str]:
+    """Return (private key without 0x prefix, funder address), read once."""
+    global _private_key, _funder
+
+    if _private_key is None:
+        # Strip 0x prefix if present (some versions require it without)
+        _funder = get_env("POLYMARKET_FUNDER_ADDRESS")
+        _private_key = get_env("POLYMARKET_WALLET_PRIVATE_KEY").removeprefix("0x")
+    return _private_key, _funder
+
+
+def get_clob_client(force_new: bool = False, signature_type: int = 2) -> ClobClient:
+    """Initialize and return CLOB client with credentials for a signature type."""
+    client = _clients.get(signature_type)
+    if client is not None and not force_new:
+        return client
+
+    private_key_clean, funder = _wallet()
 
     client = ClobClient(
         CLOB_HOST,
@@ -46,36 +156,421 @@ def get_clob_client(force_new: bool = False, signature_type: int = 2) -> ClobCli
         signature_type=signature_type,
         funder=funder,
     )
-    client.set_api_creds(client.create_or_derive_api_creds())
-    logger.info("API credentials derived successfully")
 
-    _clob_client = client
+    # Reuse persisted creds unless a refresh was forced (e.g. after a 401)
+    creds_key = f"{funder}:{signature_type}"
+    creds = None if force_new else _load_creds(creds_key)
+    if creds is not None:
+        logger.info(f"Using cached API credentials for signature_type={signature_type}")
+    else:
+        sig_type_name = _SIG_TYPE_NAMES.get(signature_type, "unknown")
+        logger.info(
+            f"Deriving API credentials with signature_type={signature_type} ({sig_type_name})..."
+        )
+        creds = client.create_or_derive_api_creds()
+        logger.info("API credentials derived successfully")
+        _save_creds(creds_key, creds)
+
+    client.set_api_creds(creds)
+
+    _clients[signature_type] = client
     return client
 
 
-def close_position(token_id: str, size: float, signature_type: int = 2) -> Dict[str, Any]:
+def _load_creds(key: str) -> Optional[ApiCreds]:
+    """Load previously derived API credentials, if any were saved."""
+    try:
+        with open(CREDS_CACHE_PATH, "r") as f:
+            cached = json.load(f).get(key)
+        return ApiCreds(**cached) if cached else None
+    except (OSError, TypeError, ValueError):
+        return None
+
+
+def _save_creds(key: str, creds: ApiCreds) -> None:
+    """Persist derived API credentials so restarts can reuse them."""
+    with _creds_lock:
+        try:
+            with open(CREDS_CACHE_PATH, "r") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            cached = {}
+
+        cached[key] = {
+            "api_key": creds.api_key,
+            "api_secret": creds.api_secret,
+            "api_passphrase": creds.api_passphrase,
+        }
+
+        try:
+            os.makedirs(os.path.dirname(CREDS_CACHE_PATH), mode=0o700, exist_ok=True)
+            # Owner-only permissions: these are trading API secrets
+            tmp_path = CREDS_CACHE_PATH + ".tmp"
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump(cached, f)
+            os.replace(tmp_path, CREDS_CACHE_PATH)
+        except OSError as e:
+            logger.warning(f"Could not save API credentials cache: {e}")
+
+
+def warm_up_clients() -> None:
+    """Derive API credentials for every signature type before the first close."""
+    for signature_type in SIGNATURE_TYPES:
+        try:
+            get_clob_client(signature_type=signature_type)
+        except Exception as e:
+            logger.warning(f"Could not prepare CLOB client (signature_type={signature_type}): {e}")
+
+
+def _auth_failure(detail: str) -> Exception:
+    return UnrecoverableError(f"Authentication failed: {detail}")
+
+
+def _no_orderbook(detail: str) -> Exception:
+    return RecoverableError("No active orderbook for this market")
+
+
+# Classification by HTTP status for structured CLOB API errors
+_STATUS_ERRORS = {
+    401: _auth_failure,
+    404: _no_orderbook,
+}
+
+
+def _error_detail(error: Exception) -> Tuple[Optional[int], str]:
+    """Extract (status_code, message) from a CLOB API error once."""
+    if isinstance(error, PolyApiException):
+        detail = error.error_msg
+        # error_msg is the parsed JSON body when the response had one
+        if isinstance(detail, dict):
+            detail = detail.get("error", detail)
+        return error.status_code, str(detail)
+    return getattr(error, "status_code", None), str(error)
+
+
+def _classify_error(error: Exception) -> Optional[Exception]:
+    """Map an order submission failure to a retry class, or None if unknown."""
+    status_code, detail = _error_detail(error)
+
+    if status_code in _STATUS_ERRORS:
+        return _STATUS_ERRORS[status_code](detail)
+
+    if _SIG_ERR_RE.search(detail):
+        return RecoverableError(f"Signature failed: {detail}")
+
+    # Server-side errors and transport failures (py-clob-client reports these
+    # without a status code) are usually transient
+    if status_code is not None and status_code >= 500:
+        return AmbiguousSubmitError(f"Request failed: {detail}")
+    if status_code is None and isinstance(error, PolyApiException):
+        return AmbiguousSubmitError(f"Request failed: {detail}")
+
+    # Errors raised without a response: fall back to the message text
+    if status_code is None:
+        if _NO_BOOK_RE.search(detail):
+            return _no_orderbook(detail)
+        if _AUTH_ERR_RE.search(detail):
+            return _auth_failure(detail)
+
+    return None
+
+
+def _find_landed_orders(
+    client: ClobClient,
+    amounts: Dict[str, float],
+    since: float,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Look for our own market sells, of amounts[token_id] shares, filled after `since`.
+
+    Used after an ambiguous post failure so a retry never double-submits an
+    order that actually filled. Trades can take a moment to show up, so the
+    check is repeated after each of LANDED_CHECK_DELAYS, with one trade-history
+    query per pass covering every token. Returns a response per landed token.
+    """
+    landed: Dict[str, Dict[str, Any]] = {}
+    if len(amounts) == 1:
+        params = TradeParams(asset_id=next(iter(amounts)), after=int(since))
+    else:
+        params = TradeParams(after=int(since))
+
+    for delay in LANDED_CHECK_DELAYS:
+        time.sleep(delay)
+        try:
+            trades = client.get_trades(params)
+        except Exception as e:
+            logger.warning(f"Could not check trades after ambiguous failure: {e}")
+            continue
+
+        # `side` is the taker's side, so only trades where we were the taker are
+        # our sells (a resting buy of ours filled by someone else also says SELL)
+        filled: Dict[Tuple[str, str], float] = {}
+        for trade in trades or []:
+            token_id = trade.get("asset_id")
+            if (
+                token_id in amounts
+                and trade.get("trader_side") == "TAKER"
+                and trade.get("side") == SELL
+            ):
+                key = (token_id, trade.get("taker_order_id") or trade.get("id"))
+                filled[key] = filled.get(key, 0.0) + float(trade.get("size") or 0)
+
+        for (token_id, order_id), size in filled.items():
+            if token_id not in landed and size >= amounts[token_id] - float(SIZE_QUANTUM) / 2:
+                logger.warning(f"Order already landed despite error (order_id={order_id})")
+                landed[token_id] = {"success": True, "orderID": order_id, "reconciled": True}
+
+        if len(landed) == len(amounts):
+            break
+    return landed
+
+
+def _sign_order(
+    signature_type: int,
+    order_args: MarketOrderArgs,
+    refresh: bool = False,
+) -> Tuple[ClobClient, Any]:
+    """
+    Build the market order signed for one signature type.
+
+    create_market_order() fills in price and fee_rate_bps on the args it is
+    given, so each sign works on its own copy: concurrent signs don't race, and
+    a later re-sign prices against the current book instead of a stale price.
+    """
+    client = get_clob_client(force_new=refresh, signature_type=signature_type)
+    return client, client.create_market_order(replace(order_args))
+
+
+def _submit_with_retry(
+    order_args: MarketOrderArgs,
+    signature_types: Tuple[int, ...] = SIGNATURE_TYPES,
+    base_delay: float = RETRY_BASE_DELAY,
+    max_delay: float = RETRY_MAX_DELAY,
+    jitter: float = RETRY_JITTER,
+) -> Dict[str, Any]:
+    """
+    Sign and post a FOK order, walking the signature types with backoff.
+
+    Orders for all signature types are signed concurrently up front, so a
+    fallback never waits on signing after a rejected post.
+
+    Recoverable errors sleep with exponential backoff and jitter, then retry with
+    the next signature type. Unrecoverable (auth) errors re-derive the cached
+    client's credentials once, then abort. Unknown errors are re-raised.
+    """
+    # One "signature_type=N: reason" entry per failed attempt
+    errors: List[str] = []
+
+    presigned = {
+        signature_type: _sign_executor.submit(_sign_order, signature_type, order_args)
+        for signature_type in signature_types
+    }
+
+    # Bound once for the retry loop rather than looked up on every attempt
+    _fok = OrderType.FOK
+    _info = logger.info
+    _warning = logger.warning
+
+    for attempt, signature_type in enumerate(signature_types):
+        if attempt:
+            delay = min(max_delay, base_delay * 2 ** (attempt - 1))
+            delay *= 1 + random.uniform(-jitter, jitter)
+            _warning(f"Retrying in {delay:.2f}s with signature_type={signature_type}...")
+            time.sleep(delay)
+
+        # Reuse the cached client; on an auth failure re-derive creds once
+        for refresh in (False, True):
+            posted_at: Optional[float] = None
+            try:
+                if refresh:
+                    client, signed_order = _sign_order(signature_type, order_args, refresh=True)
+                else:
+                    client, signed_order = presigned[signature_type].result()
+                if _debug_enabled:
+                    logger.debug("Posting FOK order (signature_type=%s)...", signature_type)
+                posted_at = time.time()
+                response = client.post_order(signed_order, orderType=_fok)
+                _info(f"Order response: {response}")
+                return response
+
+            except Exception as e:
+                error = _classify_error(e)
+                if error is None:
+                    raise
+                # Check before retrying so a filled order is never resubmitted
+                if isinstance(error, AmbiguousSubmitError) and posted_at is not None:
+                    landed = _find_landed_orders(
+                        client, {order_args.token_id: order_args.amount}, posted_at - 1
+                    )
+                    if landed:
+                        return landed[order_args.token_id]
+                if isinstance(error, UnrecoverableError) and not refresh:
+                    _warning(f"{error} - re-deriving API credentials")
+                    continue
+                break
+
+        if isinstance(error, UnrecoverableError):
+            logger.error(str(error))
+            return {"success": False, "error": str(error)}
+
+        _warning(
+            f"Attempt {attempt + 1} (signature_type={signature_type}) failed: {error}"
+        )
+        errors.append(f"signature_type={signature_type}: {error}")
+
+    error_msg = "; ".join(errors)
+    logger.error(f"All signature types failed: {error_msg}")
+    return {"success": False, "error": error_msg}
+
+
+def _round_size(size: float) -> float:
+    """
+    Round a share amount *down* to 2 decimals.
+
+    Rounding up would try to sell more shares than are held and get rejected
+    for insufficient balance.
+    """
+    return float(Decimal(str(size)).quantize(SIZE_QUANTUM, rounding=ROUND_DOWN))
+
+
+def _min_order_size(token_id: str) -> float:
+    """The market's minimum order size for token_id, fetched once per token."""
+    min_size = _min_order_sizes.get(token_id)
+    if min_size is not None:
+        return min_size
+
+    try:
+        book = get_clob_client().get_order_book(token_id)
+        min_size = max(float(book.min_order_size), MIN_ORDER_SIZE)
+    except Exception as e:
+        # Unknown minimum: let the CLOB decide rather than block the close
+        logger.warning(f"Could not fetch minimum order size for {token_id}: {e}")
+        return MIN_ORDER_SIZE
+
+    _min_order_sizes[token_id] = min_size
+    return min_size
+
+
+def _is_filled(response: Dict[str, Any]) -> bool:
+    """Whether an order response reports a placed order."""
+    return response.get("success") is not False and bool(
+        response.get("orderID") or response.get("order_id")
+    )
+
+
+def _trip_breaker(token_id: str, response: Dict[str, Any]) -> None:
+    """Open the token's breaker if the close failed for a market-side reason."""
+    error = response.get("error") or ""
+    # Errors may be joined per signature type ("signature_type=N: ..."), so match substrings
+    if not any(marker in error for marker in _BREAKER_ERRORS):
+        return
+
+    failures = _breaker_failures.get(token_id, (0, response))[0]
+    cooldown = min(BREAKER_MAX_DELAY, BREAKER_BASE_DELAY * 2**failures)
+    _breaker[token_id] = time.time() + cooldown
+    _breaker_failures[token_id] = (failures + 1, response)
+    logger.warning(f"Close failed for {token_id}, pausing closes for {cooldown}s")
+
+
+def _reset_breaker(token_id: str) -> None:
+    """Close the token's breaker after a successful close."""
+    _breaker.pop(token_id, None)
+    _breaker_failures.pop(token_id, None)
+
+
+def _block_lifted(token_id: str, rounded_size: float, failure: Dict[str, Any]) -> bool:
+    """Whether a pre-submit block has cleared before its breaker cooldown ended."""
+    # A thin live book lifts as soon as it shows bids again, and dust as soon
+    # as the position grows past the market minimum
+    if failure.get("book_blocked"):
+        return bool(orderbook_ws.is_fillable(token_id, rounded_size))
+    if failure.get("size_blocked"):
+        return rounded_size >= _min_order_size(token_id)
+    return False
+
+
+def _check_close(token_id: str, size: float) -> Tuple[float, Optional[Dict[str, Any]]]:
+    """
+    Cheap pre-submit checks shared by single and batched closes.
+
+    Returns the rounded size and, if the close should not be submitted, the
+    response to return instead.
+    """
+    rounded_size = _round_size(size)
+
+    # Skip the sign + post round-trip while the market keeps rejecting closes
+    failure = _breaker_failures.get(token_id)
+    if failure is not None and time.time() < _breaker.get(token_id, 0):
+        if _block_lifted(token_id, rounded_size, failure[1]):
+            _reset_breaker(token_id)
+        else:
+            logger.warning(f"Close breaker open for {token_id}, returning last failure")
+            return rounded_size, {**failure[1], "breaker_open": True}
+
+    min_size = _min_order_size(token_id)
+    if rounded_size < min_size:
+        logger.warning(f"Position size {rounded_size} below market minimum {min_size}")
+        blocked = {"success": False, "error": "Size too small", "size_blocked": True}
+        _trip_breaker(token_id, blocked)
+        return rounded_size, blocked
+
+    # Don't spend a sign + post round-trip when the live book shows no bids
+    if orderbook_ws.is_fillable(token_id, rounded_size) is False:
+        logger.error("Orderbook has no usable bids - not submitting close")
+        blocked = {
+            "success": False,
+            "error": "No active orderbook for this market",
+            "book_blocked": True,
+        }
+        # Through the breaker, so a thin book is reported once, not every tick
+        _trip_breaker(token_id, blocked)
+        return rounded_size, blocked
+
+    return rounded_size, None
+
+
+def _duplicate_close(token_id: str, amount: float) -> Optional[Dict[str, Any]]:
+    """Previous result if this close repeats a recent one. Call with the token lock held."""
+    closed = _closed_tokens.get(token_id)
+    # A different size means the token was bought again, so that is a new position
+    if closed is not None and time.time() - closed[0] < CLOSE_DEDUPE_WINDOW:
+        if closed[1] == amount:
+            logger.warning(f"Position {token_id} already closed, skipping duplicate close")
+            return {**closed[2], "deduped": True}
+    return None
+
+
+def _record_close(token_id: str, amount: float, response: Dict[str, Any]) -> None:
+    """Remember a filled close for dedupe, or feed a failure to the breaker."""
+    if _is_filled(response):
+        _reset_breaker(token_id)
+        _closed_tokens[token_id] = (time.time(), amount, response)
+    else:
+        _trip_breaker(token_id, response)
+
+
+def close_position(
+    token_id: str,
+    size: float,
+    signature_types: Tuple[int, ...] = SIGNATURE_TYPES,
+) -> Dict[str, Any]:
     """
     Close a position by selling all shares at market price.
 
     Args:
         token_id: The asset/token ID from the position
         size: Number of shares to sell
-        signature_type: Signature type to use (0=EOA, 1=POLY_PROXY, 2=POLY_GNOSIS_SAFE)
+        signature_types: Signature types to try in order (0=EOA, 1=POLY_PROXY, 2=POLY_GNOSIS_SAFE)
 
     Returns:
         API response from order submission
     """
-    logger.info(f"Closing position: token={token_id}, size={size}, sig_type={signature_type}")
-
-    # Get client with specified signature type
-    client = get_clob_client(force_new=True, signature_type=signature_type)
+    logger.info(f"Closing position: token={token_id}, size={size}")
 
-    # Round size to 2 decimal places for FOK orders (known py-clob-client issue)
-    rounded_size = round(size, 2)
-
-    if rounded_size <= 0:
-        logger.warning("Position size too small to close")
-        return {"success": False, "error": "Size too small"}
+    rounded_size, blocked = _check_close(token_id, size)
+    if blocked is not None:
+        return blocked
 
     order_args = MarketOrderArgs(
         token_id=token_id,
@@ -83,38 +578,227 @@ def close_position(token_id: str, size: float, signature_type: int = 2) -> Dict[
         side=SELL,
     )
 
-    logger.debug(f"Creating market sell order: token={token_id}, amount={rounded_size}")
+    # Serialize closes per token so a flapping trigger can't race two orders
+    with _close_locks.setdefault(token_id, threading.Lock()):
+        duplicate = _duplicate_close(token_id, rounded_size)
+        if duplicate is not None:
+            return duplicate
 
-    try:
-        signed_order = client.create_market_order(order_args)
-        logger.debug("Posting FOK order...")
-        response = client.post_order(signed_order, orderType=OrderType.FOK)
-        logger.info(f"Order response: {response}")
+        if _debug_enabled:
+            logger.debug(
+                "Creating market sell order: token=%s, amount=%s", token_id, rounded_size
+            )
+
+        response = _submit_with_retry(order_args, signature_types)
+        _record_close(token_id, rounded_size, response)
         return response
 
-    except Exception as e:
-        error_msg = str(e)
-
-        # Handle no orderbook
-        if "No orderbook exists" in error_msg or "404" in error_msg:
-            logger.error("Market has no active orderbook - cannot close position")
-            return {"success": False, "error": "No active orderbook for this market"}
-
-        # Handle signature errors - try different signature types
-        if "invalid signature" in error_msg.lower():
-            if signature_type == 1:
-                logger.warning("Signature failed with POLY_PROXY, trying EOA (signature_type=0)...")
-                return close_position(token_id, size, signature_type=0)
-            elif signature_type == 0:
-                logger.warning("Signature failed with EOA, trying POLY_GNOSIS_SAFE (signature_type=2)...")
-                return close_position(token_id, size, signature_type=2)
+
+def close_positions(
+    positions: List[Tuple[str, float]],
+    signature_type: int = SIGNATURE_TYPES[0],
+) -> List[Dict[str, Any]]:
+    """
+    Close several positions with a single batched order request.
+
+    Each position gets the same breaker, orderbook, lock and dedupe checks as
+    close_position(). Orders are signed concurrently and posted together via
+    the CLOB batch endpoint. If the batch fails, positions whose sell may have
+    landed are checked against trade history first; the rest fall back to the
+    per-order signature/retry handling.
+
+    Args:
+        positions: (token_id, size) pairs to sell at market price
+        signature_type: Signature type used for the batch
+
+    Returns:
+        One order response per input position, in the same order
+    """
+    logger.info(f"Closing {len(positions)} positions in one batch")
+
+    results: List[Optional[Dict[str, Any]]] = [None] * len(positions)
+    pending: List[Tuple[int, MarketOrderArgs]] = []
+    for i, (token_id, size) in enumerate(positions):
+        if any(order_args.token_id == token_id for _, order_args in pending):
+            results[i] = {"success": False, "error": "Duplicate token in batch"}
+            continue
+        rounded_size, blocked = _check_close(token_id, size)
+        if blocked is not None:
+            results[i] = blocked
+            continue
+        pending.append((i, MarketOrderArgs(token_id=token_id, amount=rounded_size, side=SELL)))
+
+    # Lock every token (in a fixed order, so batches can't deadlock each other)
+    with contextlib.ExitStack() as stack:
+        for token_id in sorted(order_args.token_id for _, order_args in pending):
+            stack.enter_context(_close_locks.setdefault(token_id, threading.Lock()))
+
+        to_post: List[Tuple[int, MarketOrderArgs]] = []
+        for i, order_args in pending:
+            duplicate = _duplicate_close(order_args.token_id, order_args.amount)
+            if duplicate is not None:
+                results[i] = duplicate
             else:
-                logger.error(f"All signature types failed: {error_msg}")
-                return {"success": False, "error": f"Signature failed: {error_msg}"}
+                to_post.append((i, order_args))
+
+        if to_post:
+            _post_batch(to_post, signature_type, results)
+
+    return [
+        result if result is not None else {"success": False, "error": "No response for order"}
+        for result in results
+    ]
+
+
+def _post_batch(
+    to_post: List[Tuple[int, MarketOrderArgs]],
+    signature_type: int,
+    results: List[Optional[Dict[str, Any]]],
+) -> None:
+    """Post one FOK batch, filling `results`. Call with every token lock held."""
+    client: Optional[ClobClient] = None
+    posted_at: Optional[float] = None
+    try:
+        client = get_clob_client(signature_type=signature_type)
+        signed_orders = list(
+            _sign_executor.map(
+                lambda item: client.create_market_order(replace(item[1])), to_post
+            )
+        )
+        posted_at = time.time()
+        responses = client.post_orders(
+            [PostOrdersArgs(order=order, orderType=OrderType.FOK) for order in signed_orders]
+        )
+    except Exception as e:
+        error = _classify_error(e)
+        # Only a definite rejection proves nothing was sold
+        ambiguous = posted_at is not None and (
+            error is None or isinstance(error, AmbiguousSubmitError)
+        )
+        logger.warning(f"Batch close failed ({error or e}), closing positions individually")
+
+        landed: Dict[str, Dict[str, Any]] = {}
+        if ambiguous:
+            landed = _find_landed_orders(
+                client,
+                {order_args.token_id: order_args.amount for _, order_args in to_post},
+                posted_at - 1,
+            )
+
+        # One token's failure must not stop the rest from being sold
+        for i, order_args in to_post:
+            response = landed.get(order_args.token_id)
+            if response is None:
+                try:
+                    response = _submit_with_retry(order_args)
+                except Exception as token_error:
+                    logger.error(f"Close of {order_args.token_id} failed: {token_error}")
+                    response = {"success": False, "error": str(token_error)}
+            _record_close(order_args.token_id, order_args.amount, response)
+            results[i] = response
+        return
+
+    for (i, order_args), response in zip(to_post, responses):
+        logger.info(f"Order response ({order_args.token_id}): {response}")
+        # Batch entries report failures in errorMsg; surface them as `error`
+        # like single-order results so the breaker and monitor see the reason
+        if not _is_filled(response) and not response.get("error"):
+            response = {
+                **response,
+                "success": False,
+                "error": response.get("errorMsg") or "Order not filled",
+            }
+        _record_close(order_args.token_id, order_args.amount, response)
+        results[i] = response
+
+
+def _submitter_loop() -> None:
+    """Run queued close requests one at a time, fulfilling their futures."""
+    while True:
+        request = _submit_q.get()
+        if not request.future.set_running_or_notify_cancel():
+            continue
+        try:
+            result = close_position(request.token_id, request.size, request.signature_types)
+        except Exception as e:
+            request.future.set_exception(e)
+        else:
+            request.future.set_result(result)
+
+
+def _ensure_submitter() -> None:
+    """Start the order submission thread on first use."""
+    global _submitter_thread
 
-        # Handle auth errors
-        if "401" in error_msg or "Unauthorized" in error_msg or "Invalid api key" in error_msg:
-            logger.error(f"Auth failed: {error_msg}")
-            return {"success": False, "error": f"Authentication failed: {error_msg}"}
+    with _submitter_lock:
+        if _submitter_thread is None:
+            _submitter_thread = threading.Thread(
+                target=_submitter_loop, name="order-submitter", daemon=True
+            )
+            _submitter_thread.start()
+
+
+def submit_close_position(
+    token_id: str,
+    size: float,
+    signature_types: Tuple[int, ...] = SIGNATURE_TYPES,
+) -> Dict[str, Any]:
+    """
+    Queue a close_position() call and acknowledge immediately.
+
+    Returns:
+        Provisional ack with the client-side request_id, the pending future and
+        status "submitted". Use reconcile(request_id) to collect the outcome.
+    """
+    _ensure_submitter()
+
+    request_id = uuid.uuid4().hex
+    request = CloseRequest(token_id, size, signature_types)
+    _submissions[request_id] = request.future
+    _submit_q.put(request)
+
+    logger.info(f"Close submitted: request_id={request_id}, token={token_id}, size={size}")
+    return {
+        "accepted": True,
+        "request_id": request_id,
+        "future": request.future,
+        "status": "submitted",
+    }
+
+
+async def aclose_position(
+    token_id: str,
+    size: float,
+    signature_types: Tuple[int, ...] = SIGNATURE_TYPES,
+) -> Dict[str, Any]:
+    """Awaitable close_position() for asyncio callers; runs on the submit thread."""
+    ack = submit_close_position(token_id, size, signature_types)
+    try:
+        return await asyncio.wrap_future(ack["future"])
+    finally:
+        _submissions.pop(ack["request_id"], None)
+
+
+def reconcile(request_id: str) -> Dict[str, Any]:
+    """
+    Resolve the outcome of a background close submitted via submit_close_position().
+
+    Returns {"status": "submitted"} while the order is still in flight; once done,
+    returns the order response. Never touches the network, so it is safe to call
+    from the monitor loop.
+    """
+    future = _submissions.get(request_id)
+    if future is None:
+        return {"success": False, "error": f"Unknown request_id {request_id}"}
+    if not future.done():
+        return {"request_id": request_id, "status": "submitted"}
+
+    del _submissions[request_id]
+
+    try:
+        result = future.result()
+    except Exception as e:
+        logger.error(f"Close request {request_id} failed: {e}")
+        return {"success": False, "error": str(e)}
 
-        raise
+    return result
@@ -10,6 +10,7 @@ import sys
 
 from bot.logger import get_logger
 from bot.monitor import run_monitor
+from bot.trading import warm_up_clients
 
 
 def main() -> None:
@@ -20,6 +21,8 @@ def main() -> None:
         logger.info("=" * 50)
         logger.info("Polymarket Stop-Loss Bot Starting")
         logger.info("=" * 50)
+        # Keep credential derivation off the stop-loss critical path
+        warm_up_clients()
         run_monitor()
     except KeyboardInterrupt:
         logger.info("Bot stopped by user (Ctrl+C)")